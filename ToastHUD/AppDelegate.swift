@@ -6,14 +6,74 @@ class AppDelegate: NSObject, NSApplicationDelegate {
 
     var window: NSWindow?
     var audioPlayer: AVAudioPlayer?
+    private var isDaemon = false
+    private var pendingToasts: [ToastConfig] = []
+    // Daemon mode keeps the last dismissed panel around so the next toast
+    // reuses it instead of allocating a fresh NSPanel + backing store.
+    private var sparePanel: ToastPanel?
+    // Bumped on every show; stale display timers compare against it so an
+    // expired (or click-dismissed) toast can never dismiss its successor,
+    // even when the successor reuses the same panel object.
+    private var toastGeneration = 0
 
     func applicationDidFinishLaunching(_ notification: Notification) {
         NSApp.setActivationPolicy(.accessory)
-        let config = ToastConfig.fromCommandLine()
-        showToast(config: config)
+        let args = CommandLine.arguments
+        if args.contains("--daemon") {
+            isDaemon = true
+            startDaemonLoop()
+        } else if let i = args.firstIndex(of: "--batch"), i + 1 < args.count {
+            // Batch mode: one invocation shows a whole queue of toasts,
+            // described as newline-delimited JSON, back to back.
+            pendingToasts = args[i + 1]
+                .split(separator: "\n")
+                .compactMap { ToastConfig.fromJSONLine(String($0)) }
+            showNextPendingToast()
+        } else {
+            let config = ToastConfig.fromCommandLine()
+            showToast(config: config)
+        }
+    }
+
+    private func showNextPendingToast(terminateWhenEmpty: Bool = true) {
+        guard !pendingToasts.isEmpty else {
+            if terminateWhenEmpty {
+                NSApp.terminate(nil)
+            }
+            return
+        }
+        showToast(config: pendingToasts.removeFirst())
+    }
+
+    /// Daemon mode: read newline-delimited JSON toast requests from stdin so a
+    /// client can reuse one ToastHUD process for many toasts instead of paying
+    /// app startup per notification. EOF means the client is gone.
+    private func startDaemonLoop() {
+        DispatchQueue.global(qos: .userInitiated).async { [weak self] in
+            while let line = readLine(strippingNewline: true) {
+                guard let config = ToastConfig.fromJSONLine(line) else { continue }
+                DispatchQueue.main.async {
+                    self?.showToast(config: config)
+                }
+            }
+            DispatchQueue.main.async {
+                NSApp.terminate(nil)
+            }
+        }
     }
 
     private func showToast(config: ToastConfig) {
+        // One toast at a time: while one is on screen - or fading out with
+        // others already queued (window is cleared when the fade starts) -
+        // daemon requests queue up behind it (the same machinery --batch
+        // uses) instead of overwriting self.window and jumping the FIFO.
+        if isDaemon && (window != nil || !pendingToasts.isEmpty) {
+            pendingToasts.append(config)
+            return
+        }
+        toastGeneration += 1
+        let generation = toastGeneration
+
         let contentView = ToastView(
             message: config.message,
             fontSize: config.fontSize,
@@ -25,7 +85,7 @@ class AppDelegate: NSObject, NSApplicationDelegate {
             icon: config.icon,
             clickToDismiss: config.clickToDismiss,
             onTap: config.clickToDismiss ? { [weak self] in
-                self?.dismissToast(fadeOutDuration: config.fadeOutDuration)
+                self?.dismissToast(fadeOutDuration: config.fadeOutDuration, ackId: config.ackId)
             } : nil
         )
 
@@ -84,11 +144,20 @@ class AppDelegate: NSObject, NSApplicationDelegate {
 
         let frame = NSRect(origin: origin, size: toastSize)
 
-        let panel = ToastPanel(
-            contentRect: frame,
-            contentViewController: hostingController,
-            clickToDismiss: config.clickToDismiss
-        )
+        let panel: ToastPanel
+        if let spare = sparePanel {
+            sparePanel = nil
+            spare.setFrame(frame, display: false)
+            spare.contentViewController = hostingController
+            spare.ignoresMouseEvents = !config.clickToDismiss
+            panel = spare
+        } else {
+            panel = ToastPanel(
+                contentRect: frame,
+                contentViewController: hostingController,
+                clickToDismiss: config.clickToDismiss
+            )
+        }
 
         if let levelStr = config.windowLevel {
             switch levelStr.lowercased() {
@@ -99,23 +168,39 @@ class AppDelegate: NSObject, NSApplicationDelegate {
             case "max", "screensaver": panel.level = .screenSaver
             default: panel.level = .screenSaver
             }
+        } else {
+            // Explicit default: a reused spare panel would otherwise keep
+            // whatever level the previous toast requested.
+            panel.level = .screenSaver
         }
 
         // Make sure the content view matches the requested size too
         hostingController.view.frame = NSRect(origin: .zero, size: toastSize)
 
+        // Order front and fade in inside one animation group: a single
+        // compositor commit instead of two. makeKeyAndOrderFront is pointless
+        // here - ToastPanel.canBecomeKey is false, so it degenerated to a
+        // second ordering pass.
         panel.alphaValue = 0
-        panel.orderFrontRegardless()
         self.window = panel
-        self.window?.makeKeyAndOrderFront(nil)
-        // Fade in
-        NSAnimationContext.runAnimationGroup { context in
+        // Shadow recomputation on every alpha step of a borderless
+        // transparent window is a known source of fade jank; keep the shadow
+        // off while animating and attach it once at steady state.
+        panel.hasShadow = false
+        NSAnimationContext.runAnimationGroup({ context in
             context.duration = config.fadeInDuration
+            panel.orderFrontRegardless()
             panel.animator().alphaValue = 1.0
-        }
+        }, completionHandler: {
+            panel.hasShadow = true
+            panel.invalidateShadow()
+        })
 
         DispatchQueue.main.asyncAfter(deadline: .now() + config.displayDuration) { [weak self, config] in
-            self?.dismissToast(fadeOutDuration: config.fadeOutDuration)
+            // No-op if this toast is already gone (click-dismissed) and a
+            // newer one is showing; the timer belongs to one generation only.
+            guard let self = self, self.toastGeneration == generation else { return }
+            self.dismissToast(fadeOutDuration: config.fadeOutDuration, ackId: config.ackId)
         }
     }
     
@@ -160,18 +245,37 @@ class AppDelegate: NSObject, NSApplicationDelegate {
         }
     }
 
-    private func dismissToast(fadeOutDuration: TimeInterval) {
+    private func dismissToast(fadeOutDuration: TimeInterval, ackId: String? = nil) {
         guard let panel = self.window else {
-            NSApp.terminate(nil)
+            if !isDaemon && pendingToasts.isEmpty {
+                NSApp.terminate(nil)
+            }
             return
         }
+        // Claim the panel up front: a second dismissal request during the
+        // fade (double click, stale timer) sees window == nil and cannot
+        // re-run the animation or its completion side effects.
+        self.window = nil
 
+        panel.hasShadow = false
         NSAnimationContext.runAnimationGroup({ context in
             context.duration = fadeOutDuration
             panel.animator().alphaValue = 0.0
-        }, completionHandler: {
+        }, completionHandler: { [weak self] in
             panel.orderOut(nil)
-            NSApp.terminate(nil)
+            guard let self = self else { return }
+            if self.isDaemon {
+                self.sparePanel = panel as? ToastPanel
+                // One line per dismissed toast, echoing the request's id so
+                // blocking clients can wait for their own toast rather than
+                // whichever ack arrives first.
+                FileHandle.standardOutput.write(((ackId ?? "ok") + "\n").data(using: .utf8)!)
+                self.showNextPendingToast(terminateWhenEmpty: false)
+            } else if !self.pendingToasts.isEmpty {
+                self.showNextPendingToast()
+            } else {
+                NSApp.terminate(nil)
+            }
         })
     }
 }
\ No newline at end of file
@@ -37,6 +37,7 @@ struct ToastConfig {
     var icon: String?  // SF Symbol name (e.g., "checkmark.circle.fill")
     var clickToDismiss: Bool = true
     var sound: String?  // Path to sound file
+    var ackId: String?  // Daemon protocol: echoed on stdout when dismissed
 }
 
 extension ToastConfig {
@@ -96,6 +97,12 @@ extension ToastConfig {
                 config.clickToDismiss = false
             } else if arg == "--sound", let value = readValue(after: &i) {
                 config.sound = value
+            } else if arg == "--config", let value = readValue(after: &i) {
+                // Whole config packed into one JSON token; takes priority
+                // over any individual flags seen so far.
+                if let jsonConfig = ToastConfig.fromJSONLine(value) {
+                    config = jsonConfig
+                }
             } else if arg.hasPrefix("--") {
                 // Unknown flag – ignore it (and optional value)
                 // If it has a value that doesn't start with --, skip that too
@@ -118,6 +125,50 @@ extension ToastConfig {
     }
 }
 
+extension ToastConfig {
+    /// Parses one newline-delimited JSON daemon request. Keys mirror the
+    /// command-line flag names (without the leading dashes).
+    static func fromJSONLine(_ line: String) -> ToastConfig? {
+        guard let data = line.data(using: .utf8),
+              let dict = (try? JSONSerialization.jsonObject(with: data)) as? [String: Any],
+              let message = dict["message"] as? String else {
+            return nil
+        }
+
+        var config = ToastConfig(message: message)
+
+        func number(_ key: String) -> CGFloat? {
+            (dict[key] as? NSNumber).map { CGFloat(truncating: $0) }
+        }
+
+        if let w = number("width") { config.width = max(50, w) }
+        if let h = number("height") { config.height = max(30, h) }
+        if let fs = number("font-size") { config.fontSize = max(8, fs) }
+        if let hex = dict["bg"] as? String, let color = NSColor.fromHexString(hex) {
+            config.backgroundColor = color
+        }
+        if let hex = dict["text-color"] as? String, let color = NSColor.fromHexString(hex) {
+            config.textColor = color
+        }
+        if let pos = dict["position"] as? String, let p = ToastPosition(rawValue: pos.lowercased()) {
+            config.position = p
+        }
+        if let cr = number("corner-radius") { config.cornerRadius = max(0, cr) }
+        if let d = dict["display-duration"] as? Double { config.displayDuration = max(0.1, d) }
+        if let d = dict["fade-out-duration"] as? Double { config.fadeOutDuration = max(0.0, d) }
+        if let d = dict["fade-in-duration"] as? Double { config.fadeInDuration = max(0.0, d) }
+        if let x = number("x") { config.x = x }
+        if let y = number("y") { config.y = y }
+        if let level = dict["window-level"] as? String { config.windowLevel = level }
+        if let icon = dict["icon"] as? String { config.icon = icon }
+        if let click = dict["click-to-dismiss"] as? Bool { config.clickToDismiss = click }
+        if let sound = dict["sound"] as? String { config.sound = sound }
+        if let ackId = dict["id"] as? String { config.ackId = ackId }
+
+        return config
+    }
+}
+
 extension NSColor {
     /// Parses "#RRGGBB", "RRGGBB", or "RRGGBBAA"
     static func fromHexString(_ hex: String) -> NSColor? {
@@ -1,6 +1,6 @@
 import rumps
-from mactoast import show_toast
-from mactoast.styles import show_info, show_warning, show_error, show_success
+from mactoast import show_toast, toast_sequence
+from mactoast.styles import ToastStyle, show_info, show_warning, show_error, show_success
 import time
 class AwesomeToastsApp(rumps.App):
     def __init__(self):
@@ -16,24 +16,16 @@ class AwesomeToastsApp(rumps.App):
         )
     @rumps.clicked("Warning")
     def warning(self, _):
-        show_warning(
-            message="Warning! Check this out.",
-            display_duration=0.3,
-            fade_duration=0.3,
-            font_size=18,
-        )
-        show_warning(
-            message="Warning! Check this out.",
-            display_duration=0.3,
-            fade_duration=0.3,
-            font_size=18,
-        )
-        show_warning(
-            message="Warning! Check this out.",
-            display_duration=0.3,
-            fade_duration=0.3,
-            font_size=18,
-        )
+        # Three rapid warnings batched into one ToastHUD invocation instead
+        # of three sequential process spawns.
+        toast_sequence([
+            {
+                **ToastStyle.WARNING,
+                "message": "Warning! Check this out.",
+                "display_duration": 0.3,
+                "font_size": 18,
+            },
+        ] * 3)
     @rumps.clicked("Error")
     def error(self, _):
         show_error(
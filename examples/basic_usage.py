@@ -6,7 +6,7 @@ This example demonstrates STANDALONE mode - for standalone Python scripts
 that don't have an existing NSApplication.
 """
 
-from mactoast import toast, ToastPosition, WindowLevel, show_success, show_error
+from mactoast import toast, toast_sequence, ToastPosition, WindowLevel, show_success, show_error
 import time
 
 
@@ -49,7 +49,7 @@ def example_custom_timing():
     print("Showing toast with longer display time...")
     toast(
         "Slow fade out...",
-        display_duration=1.0,
+        display_duration=3.0,
         fade_out_duration=2.0,
         position=ToastPosition.BOTTOM_LEFT
     )
@@ -78,21 +78,54 @@ def example_window_level():
     )
 
 
+def example_sequence():
+    """All of the above as one batched ToastHUD invocation."""
+    toast_sequence([
+        {
+            "message": "Hello, World!",
+            "bg": (0.2, 0.2, 0.2),
+            "text_color": (1.0, 1.0, 1.0),
+            "display_duration": 2.0,
+            "position": ToastPosition.CENTER,
+            "window_level": WindowLevel.FLOATING,
+        },
+        {
+            "message": "Blue notification",
+            "bg": (0.0, 0.5, 1.0),
+            "text_color": (1.0, 1.0, 1.0),
+            "display_duration": 2.0,
+            "position": "top-right",
+            "window_level": WindowLevel.FLOATING,
+        },
+        {
+            "message": "Slow fade out...",
+            "display_duration": 3.0,
+            "fade_out_duration": 2.0,
+            "position": ToastPosition.BOTTOM_LEFT,
+        },
+        {
+            "message": "Top right corner (custom coords)",
+            "position": (1200, 800),
+            "bg": (0.8, 0.2, 0.2),
+            "corner_radius": 10,
+            "display_duration": 2.0,
+        },
+        {
+            "message": "Always on top!",
+            "window_level": WindowLevel.MAX,
+            "display_duration": 2.0,
+            "bg": (0.5, 0.0, 0.5),
+        },
+    ])
+
+
 if __name__ == "__main__":
     print("=== Mactoast Standalone Examples ===\n")
-    
-    example_basic()
-    time.sleep(3)
-    
-    example_colored()
-    time.sleep(3)
-    
-    example_custom_timing()
-    time.sleep(3)
 
-    example_positioned()
-    time.sleep(3)
+    # One ToastHUD process (and one Cocoa startup) for the whole tour instead
+    # of one per example; the functions above remain as individually runnable
+    # demos of the same toasts.
+    print("Showing all examples as one batched sequence...")
+    example_sequence()
 
-    example_window_level()
-    
     print("\n=== All examples completed! ===")
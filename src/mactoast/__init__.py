@@ -8,14 +8,15 @@ Quick Start:
     >>> show_toast('Hello, World!')
     >>> show_toast('Success!', bg=(0.0, 0.8, 0.0))
 """
-from ._runner import toast, ToastPosition, WindowLevel, ToastConfigError
-from .styles import show_success, show_error, show_warning, show_info, ToastStyle
+from ._runner import toast, toast_sequence, validate_many, ToastPosition, WindowLevel, ToastConfigError
 
 # Alias for backward compatibility or preference
 show_toast = toast
 
 __all__ = [
     "toast",
+    "toast_sequence",
+    "validate_many",
     "show_toast",
     "ToastPosition",
     "WindowLevel",
@@ -26,3 +27,19 @@ __all__ = [
     "show_info",
     "ToastStyle",
 ]
+
+# The style helpers are resolved lazily (PEP 562) so scripts that only use
+# toast()/show_toast() never pay for importing .styles.
+_STYLE_EXPORTS = frozenset(
+    {"show_success", "show_error", "show_warning", "show_info", "ToastStyle"}
+)
+
+
+def __getattr__(name):
+    if name in _STYLE_EXPORTS:
+        from . import styles
+
+        value = getattr(styles, name)
+        globals()[name] = value  # cache so later lookups skip this hook
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,14 +1,36 @@
+from __future__ import annotations
+
+import functools
+import json
 import os
 import sys
-import subprocess
-from typing import Optional, Union, Tuple
+import time
+from typing import Optional, Union, Tuple, TYPE_CHECKING
 from enum import Enum
 
-try:
-    from importlib.resources import files as resource_files
-except ImportError:
-    # Python < 3.9
-    import importlib.resources as resource_files  # type: ignore
+if TYPE_CHECKING:
+    import concurrent.futures
+    import subprocess
+
+# subprocess entry points, bound on first use by _load_subprocess(). Deferring
+# the import keeps `import mactoast` cheap for scripts that never show a toast
+# (subprocess transitively pulls in signal/selectors/threading); the bound
+# names still save a LOAD_GLOBAL + LOAD_ATTR pair per reference afterwards.
+_run = None
+_Popen = None
+_PIPE = None
+_DEVNULL = None
+
+
+def _load_subprocess() -> None:
+    global subprocess, _run, _Popen, _PIPE, _DEVNULL
+    if _run is None:
+        import subprocess
+
+        _run = subprocess.run
+        _Popen = subprocess.Popen
+        _PIPE = subprocess.PIPE
+        _DEVNULL = subprocess.DEVNULL
 
 # Default constants
 DEFAULT_WIDTH = 280
@@ -36,6 +58,26 @@ class WindowLevel(str, Enum):
     SCREENSAVER = "screensaver"
 
 
+# CLI tokens for the enum members, resolved once at import so the hot path
+# skips the isinstance check and .value attribute load; interned because the
+# same few strings are reused on every call.
+_POS_TOKEN = {p: sys.intern(p.value) for p in ToastPosition}
+_WL_TOKEN = {w: sys.intern(w.value) for w in WindowLevel}
+
+# Valid-value sets for the validators, computed once at import for O(1)
+# membership tests; the list forms are only rendered lazily inside the raise
+# branches for error messages.
+_POSITION_VALUES = frozenset(_POS_TOKEN.values())
+_WINDOW_LEVEL_VALUES = frozenset(_WL_TOKEN.values())
+_VALID_SOUNDS = frozenset({
+    'beep1', 'beep2', 'beep3', 'beep4', 'beep5',
+    'confirmation1', 'confirmation2', 'confirmation3', 'confirmation4', 'confirmation5',
+    'pop1', 'pop2', 'pop3',
+    'scifi1', 'scifi2', 'scifi3',
+    'click1',
+})
+_VALID_SOUND_EXTS = frozenset({'.wav', '.mp3', '.m4a', '.aac', '.aiff', '.caf'})
+
 ColorType = Union[str, Tuple[float, float, float], Tuple[float, float, float, float]]
 
 
@@ -58,7 +100,9 @@ def _validate_color(color: ColorType, param_name: str) -> None:
                 f"{param_name} hex string must be 6 or 8 characters "
                 f"(RGB or RGBA). Got: {color}"
             )
-    elif isinstance(color, (tuple, list)):
+    elif isinstance(color, tuple):
+        # Lists are normalized to tuples at the toast()/toast_sequence()
+        # boundary, so a single-type isinstance check suffices here.
         if len(color) not in (3, 4):
             raise ToastConfigError(
                 f"{param_name} tuple must have 3 (RGB) or 4 (RGBA) values. "
@@ -82,7 +126,7 @@ def _validate_color(color: ColorType, param_name: str) -> None:
 
 def _validate_position(position: Union[ToastPosition, str, Tuple[float, float]]) -> None:
     """Validate position format."""
-    if isinstance(position, (tuple, list)):
+    if isinstance(position, tuple):
         if len(position) != 2:
             raise ToastConfigError(
                 f"position tuple must have exactly 2 values (x, y). "
@@ -94,10 +138,10 @@ def _validate_position(position: Union[ToastPosition, str, Tuple[float, float]])
                     f"position[{i}] must be a number. Got: {type(val).__name__}"
                 )
     elif isinstance(position, str):
-        valid_positions = [p.value for p in ToastPosition]
-        if position not in valid_positions:
+        if position not in _POSITION_VALUES:
             raise ToastConfigError(
-                f"position must be one of {valid_positions}. Got: {position}"
+                f"position must be one of {[p.value for p in ToastPosition]}. "
+                f"Got: {position}"
             )
     elif not isinstance(position, ToastPosition):
         raise ToastConfigError(
@@ -109,10 +153,10 @@ def _validate_position(position: Union[ToastPosition, str, Tuple[float, float]])
 def _validate_window_level(level: Union[WindowLevel, str]) -> None:
     """Validate window level."""
     if isinstance(level, str):
-        valid_levels = [l.value for l in WindowLevel]
-        if level not in valid_levels:
+        if level not in _WINDOW_LEVEL_VALUES:
             raise ToastConfigError(
-                f"window_level must be one of {valid_levels}. Got: {level}"
+                f"window_level must be one of {[l.value for l in WindowLevel]}. "
+                f"Got: {level}"
             )
     elif not isinstance(level, WindowLevel):
         raise ToastConfigError(
@@ -219,67 +263,266 @@ def _validate_durations(
 
 def _validate_sound(sound: str) -> None:
     """Validate sound parameter."""
-    # If it's an absolute path, just check it exists
+    # If it's an absolute path, just check it exists. A single os.stat in
+    # try/except is one syscall; os.path.exists wraps the same stat but pays
+    # an extra function call and swallows the error only to re-branch on it.
     if sound.startswith("/"):
-        if not os.path.exists(sound):
+        try:
+            os.stat(sound)
+        except OSError:
             raise ToastConfigError(
                 f"Sound file not found: {sound}"
             )
-        # Check extension
-        if not sound.lower().endswith(('.wav', '.mp3', '.m4a', '.aac', '.aiff', '.caf')):
+        # Check extension; only lowercase the extension, not the whole path
+        dot = sound.rfind('.')
+        ext = sound[dot:].lower() if dot >= 0 else ''
+        if ext not in _VALID_SOUND_EXTS:
             raise ToastConfigError(
                 f"Sound file must be .wav, .mp3, .m4a, .aac, .aiff, or .caf. "
                 f"Got: {sound}"
             )
     else:
         # It's a bundled sound name - validate it
-        valid_sounds = [
-            'beep1', 'beep2', 'beep3', 'beep4', 'beep5',
-            'confirmation1', 'confirmation2', 'confirmation3', 'confirmation4', 'confirmation5',
-            'pop1', 'pop2', 'pop3',
-            'scifi1', 'scifi2', 'scifi3',
-            'click1',
-        ]
-        if sound not in valid_sounds:
+        if sound not in _VALID_SOUNDS:
             raise ToastConfigError(
                 f"Unknown sound name: {sound}. "
-                f"Valid sounds: {', '.join(valid_sounds)}"
+                f"Valid sounds: {', '.join(sorted(_VALID_SOUNDS))}"
             )
 
 
+@functools.lru_cache(maxsize=1)
 def _get_executable_path() -> str:
+    """Resolve the bundled ToastHUD executable.
+
+    The importlib.resources traversal and existence check only run once per
+    process; every subsequent toast() call reuses the cached path.
+    """
     if sys.platform != "darwin":
         raise RuntimeError("mactoast currently only supports macOS.")
 
-    # Locate ToastHUD.app inside this package
+    # Locate ToastHUD.app inside this package; the importlib.resources
+    # import is deferred to first use (this function is cached, so it runs
+    # at most once per process).
+    try:
+        from importlib.resources import files as resource_files
+    except ImportError:
+        # Python < 3.9
+        import importlib.resources as resource_files  # type: ignore
+
     base = resource_files(__package__)
     app = base / "ToastHUD.app" / "Contents" / "MacOS" / "ToastHUD"
 
     path = str(app)
-    if not os.path.exists(path):
+    try:
+        os.stat(path)
+    except OSError:
         raise FileNotFoundError(f"Toast executable not found at {path}")
     return path
 
 
+# Warm the path cache at import on macOS so the first toast() pays nothing.
+# lru_cache does not memoize exceptions, so a missing bundle still raises at
+# call time with the usual error. The warm-up also pulls in
+# importlib.resources, so on darwin the deferred import inside
+# _get_executable_path only helps when MACTOAST_LAZY_INIT=1 skips this block
+# and shifts the whole lookup to the first call.
+if sys.platform == "darwin" and os.environ.get("MACTOAST_LAZY_INIT") != "1":
+    try:
+        _get_executable_path()
+    except FileNotFoundError:
+        pass
+
+
+class _SpawnedToast:
+    """Minimal handle for a toast spawned via os.posix_spawn.
+
+    Cheaper than a full subprocess.Popen for fire-and-forget toasts: no pipe
+    setup and no Popen state machine, just a pid.
+    """
+
+    __slots__ = ("pid",)
+
+    def __init__(self, pid: int):
+        self.pid = pid
+
+    def wait(self) -> int:
+        try:
+            _, status = os.waitpid(self.pid, 0)
+        except ChildProcessError:
+            # Already collected by the opportunistic reap in toast().
+            return 0
+        _forget_fast_pid(self.pid)
+        return status
+
+
+# Outstanding fast-spawn pids. Unlike subprocess.Popen, os.posix_spawn has no
+# finalizer reaping exited children, and fire-and-forget callers never wait()
+# - each new fast spawn sweeps this list with WNOHANG so a long-running
+# notifier does not accumulate one zombie per toast.
+_FAST_PIDS = []
+
+
+def _reap_fast_pids() -> None:
+    if not _FAST_PIDS:
+        return
+    alive = []
+    for pid in _FAST_PIDS:
+        try:
+            done, _ = os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            continue
+        if done == 0:
+            alive.append(pid)
+    _FAST_PIDS[:] = alive
+
+
+def _forget_fast_pid(pid: int) -> None:
+    try:
+        _FAST_PIDS.remove(pid)
+    except ValueError:
+        pass
+
+
+_EXECUTOR = None
+
+
+def _get_executor():
+    """Lazily create the shared thread pool used for background toasts."""
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        import concurrent.futures
+
+        _EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="mactoast"
+        )
+    return _EXECUTOR
+
+
+# Pack the whole toast config into a single --config JSON argv token instead
+# of ~20 individual flags, so the Swift side does one JSONSerialization call
+# rather than N option-parser dispatches. Opt-in until the bundled
+# ToastHUD.app is rebuilt with --config support; per-flag argv stays the
+# compatibility default.
+_USE_JSON_ARGV = os.environ.get("MACTOAST_JSON_ARGV") == "1"
+
+# Monotonic dispatch times of recent toasts, keyed by (message, bg, position),
+# used by toast()'s opt-in coalescing.
+_LAST_DISPATCH = {}
+
+_HELPER: Optional[subprocess.Popen] = None
+
+
+def _get_helper() -> subprocess.Popen:
+    """Return the long-lived ToastHUD helper process, launching it on first use.
+
+    The helper runs ToastHUD with ``--daemon`` and accepts newline-delimited
+    JSON toast requests on stdin, so Cocoa/AppKit startup is paid once per
+    process instead of once per toast. A dead helper is relaunched
+    transparently.
+    """
+    global _HELPER
+    _load_subprocess()
+    if _HELPER is None or _HELPER.poll() is not None:
+        _HELPER = _Popen(
+            [_get_executable_path(), "--daemon"],
+            stdin=_PIPE,
+            stdout=_PIPE,
+            text=True,
+        )
+    return _HELPER
+
+
+# Monotonically increasing daemon request id; echoed back by the helper on
+# dismissal so blocking senders can wait for their own toast's ack even when
+# non-blocking sends (whose acks are drained wholesale) share the helper.
+_HELPER_SEQ = 0
+
+
+def _drain_helper_acks(helper) -> None:
+    """Discard any queued per-toast acknowledgement lines without blocking.
+
+    The helper writes one "ok" line per dismissed toast. Non-blocking daemon
+    clients never read them; left to accumulate they would eventually fill
+    the stdout pipe and stall the helper's main thread mid-dismissal.
+    """
+    fd = helper.stdout.fileno()
+    os.set_blocking(fd, False)
+    try:
+        while os.read(fd, 4096):
+            pass
+    except (BlockingIOError, OSError):
+        pass
+    finally:
+        os.set_blocking(fd, True)
+
+
+@functools.lru_cache(maxsize=64)
+def _tuple_to_hex(color: Tuple[float, ...]) -> str:
+    """Convert a 0.0-1.0 float tuple to a hex string.
+
+    Cached because the same handful of tuples (the ToastStyle presets plus a
+    few user colors) tend to recur on every call.
+    """
+    # Branchless: the bytes length encodes RGB vs RGBA, and bytes.hex()
+    # formats every channel in a single C call. The mask keeps stray values
+    # byte-sized rather than raising from the bytes constructor.
+    return "#" + bytes(int(c * 255) & 0xFF for c in color).hex().upper()
+
+
+def _fmt_num(value) -> str:
+    """Format a numeric argv token, collapsing integer-valued floats.
+
+    '300' is cheaper to produce and parse than '300.0', and CPython's
+    shortest-repr float formatter is avoided for the common integral case.
+    """
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
 def _normalize_color(color: ColorType) -> str:
     """Convert a color (hex string or tuple) to a hex string."""
-    if isinstance(color, str):
+    # Exact type checks: one pointer compare each, versus isinstance walking
+    # the MRO. The declared input types are exactly str/tuple/list.
+    t = type(color)
+    if t is str:
         return color
-    
-    if isinstance(color, (tuple, list)):
-        # Assume 0.0-1.0 floats
-        r = int(color[0] * 255)
-        g = int(color[1] * 255)
-        b = int(color[2] * 255)
-        if len(color) > 3:
-            a = int(color[3] * 255)
-            return f"#{r:02X}{g:02X}{b:02X}{a:02X}"
-        else:
-            return f"#{r:02X}{g:02X}{b:02X}"
-            
+    if t is tuple:
+        return _tuple_to_hex(color)
+    if t is list:
+        return _tuple_to_hex(tuple(color))
+
     raise ValueError(f"Invalid color format: {color}")
 
 
+# Declarative (config key, converter) spec driving config/argv construction in
+# toast(). Config keys double as the ToastHUD CLI flag names (minus the leading
+# dashes); a converter of None passes the value through unchanged. position,
+# window_level and click_to_dismiss need per-type handling and stay out of the
+# table.
+_CFG_SPEC = (
+    ("width", None),
+    ("height", None),
+    ("bg", _normalize_color),
+    ("font-size", None),
+    ("text-color", _normalize_color),
+    ("corner-radius", None),
+    ("display-duration", None),
+    ("fade-out-duration", None),
+    ("fade-in-duration", None),
+    ("icon", str),
+    ("sound", str),
+)
+
+# Interned "--flag" argv tokens: one shared string per flag for the process
+# lifetime instead of a fresh f-string allocation on every call.
+_FLAG_TOKEN = {key: sys.intern("--" + key) for key, _ in _CFG_SPEC}
+_FLAG_TOKEN.update(
+    (key, sys.intern("--" + key)) for key in ("x", "y", "position", "window-level")
+)
+
+
+@functools.lru_cache(maxsize=256)
 def _calculate_auto_size(
     message: str,
     font_size: float,
@@ -290,6 +533,9 @@ def _calculate_auto_size(
     """
     Calculate optimal width, height, and corner radius for auto-sized toast.
     Returns (width, height, corner_radius).
+
+    Memoized: repeated toasts with the same text and geometry inputs skip
+    the arithmetic entirely.
     """
     # Approximate character width (varies by font, but good estimate for system font)
     avg_char_width = font_size * 0.6
@@ -327,7 +573,8 @@ def _calculate_auto_size(
     return (final_width, final_height, corner_radius)
 
 
-def toast(
+@functools.lru_cache(maxsize=128)
+def _build_config(
     message: str,
     width: Optional[float] = None,
     height: Optional[float] = None,
@@ -346,94 +593,77 @@ def toast(
     min_width: Optional[float] = None,
     max_width: Optional[float] = None,
     sound: Optional[str] = None,
-    blocking: bool = True,
-    check: bool = False,
-) -> Union[subprocess.CompletedProcess, subprocess.Popen]:
+) -> dict:
     """
-    Show a macOS HUD toast using the bundled ToastHUD.app.
+    Validate toast parameters and return the normalized config dict.
+
+    Keys match the ToastHUD command-line flag names; the dict is shared by
+    the one-shot CLI, daemon, and batch protocols. The message itself is not
+    included.
+
+    Memoized: repeated identical calls (a logger emitting the same toast, the
+    style presets) skip every validator and color conversion. Callers must
+    treat the returned dict as read-only and all arguments must be hashable
+    (lists are converted to tuples in toast()/toast_sequence()).
 
-    Args:
-        message: The message to display.
-        width: Width of the toast in points (ignored if auto_size=True).
-        height: Height of the toast in points (ignored if auto_size=True).
-        bg: Background color (hex string or (r,g,b) tuple of 0-1 floats).
-        position: Position on screen ("top-right", "center", etc) or (x, y) coordinates.
-        font_size: Font size in points. Default: 14.
-        text_color: Text color (hex string or (r,g,b) tuple of 0-1 floats).
-        corner_radius: Corner radius in points (auto-adjusted if auto_size=True).
-        display_duration: How long to show the toast (seconds). Default: 2.5.
-        fade_out_duration: Duration of fade out animation (seconds). Default: 0.2.
-        fade_in_duration: Duration of fade in animation (seconds). Default: 0.2.
-        window_level: Window level ("normal", "floating", "status", "modal", "max").
-        icon: SF Symbol name (e.g., "checkmark.circle.fill", "xmark.circle.fill").
-        click_to_dismiss: If True, clicking the toast dismisses it. Default: True.
-        auto_size: If True, automatically size the toast based on content. Default: False.
-        min_width: Minimum width when auto_size=True. Default: 100.
-        max_width: Maximum width when auto_size=True. Default: 400.
-        sound: Sound name ('click1', 'confirmation1', 'confirmation2') or absolute path. Default: None (no sound).
-        blocking: If True, wait for the toast to close before returning.
-        check: If True, raise a CalledProcessError if the toast app fails (only if blocking=True).
-    
     Raises:
         ToastConfigError: If parameters are invalid or incompatible.
-        RuntimeError: If not running on macOS.
-        FileNotFoundError: If ToastHUD.app executable is not found.
     """
     # Validate message
     if not message or not isinstance(message, str):
         raise ToastConfigError("message must be a non-empty string")
-    
-    # Validate dimensions and auto_size interactions
-    _validate_dimensions(width, height, auto_size, min_width, max_width)
-    
+
+    # Validate dimensions and auto_size interactions; with no dimension
+    # arguments at all there is nothing to cross-check, so the common
+    # defaults-only call skips the walk entirely.
+    if (
+        auto_size
+        or width is not None
+        or height is not None
+        or min_width is not None
+        or max_width is not None
+    ):
+        _validate_dimensions(width, height, auto_size, min_width, max_width)
+
     # Validate colors
     if bg is not None:
         _validate_color(bg, "bg")
     if text_color is not None:
         _validate_color(text_color, "text_color")
-    
+
     # Validate position
     if position is not None:
         _validate_position(position)
-    
+
     # Validate window level
     if window_level is not None:
         _validate_window_level(window_level)
-    
+
     # Validate numeric parameters
     if font_size is not None:
         _validate_numeric_range(font_size, "font_size", 8, 72)
-    
+
     if corner_radius is not None:
         _validate_numeric_range(corner_radius, "corner_radius", 0, 100)
-    
+
     # Validate durations
     _validate_durations(display_duration, fade_in_duration, fade_out_duration)
-    
+
     # Validate sound
     if sound is not None:
         _validate_sound(sound)
-    
+
     # Validate icon (basic check - just ensure it's a string)
     if icon is not None and not isinstance(icon, str):
         raise ToastConfigError(
             f"icon must be a string (SF Symbol name). Got: {type(icon).__name__}"
         )
-    
-    # Validate blocking/check interaction
-    if check and not blocking:
-        raise ToastConfigError(
-            "check=True only makes sense when blocking=True. "
-            "Non-blocking mode cannot check exit status."
-        )
-    
-    exe = _get_executable_path()
-    
+
     # Use defaults
     effective_font_size = font_size if font_size is not None else DEFAULT_FONT_SIZE
     effective_min_width = min_width if min_width is not None else DEFAULT_MIN_WIDTH
     effective_max_width = max_width if max_width is not None else DEFAULT_MAX_WIDTH
-    
+
     # Calculate size if auto_size is enabled
     if auto_size:
         calc_width, calc_height, calc_corner_radius = _calculate_auto_size(
@@ -449,50 +679,345 @@ def toast(
         if corner_radius is None:
             corner_radius = calc_corner_radius
 
-    args = [exe]
+    values = {
+        "width": width,
+        "height": height,
+        "bg": bg,
+        "font-size": font_size,
+        "text-color": text_color,
+        "corner-radius": corner_radius,
+        "display-duration": display_duration,
+        "fade-out-duration": fade_out_duration,
+        "fade-in-duration": fade_in_duration,
+        "icon": icon,
+        "sound": sound,
+    }
+    cfg = {}
+    for key, conv in _CFG_SPEC:
+        value = values[key]
+        if value is not None:
+            cfg[key] = conv(value) if conv is not None else value
 
-    if width is not None:
-        args.extend(["--width", str(width)])
-    if height is not None:
-        args.extend(["--height", str(height)])
-    if bg is not None:
-        args.extend(["--bg", _normalize_color(bg)])
     if position is not None:
-        if isinstance(position, (tuple, list)) and len(position) == 2:
-            args.extend(["--x", str(position[0])])
-            args.extend(["--y", str(position[1])])
+        if isinstance(position, tuple) and len(position) == 2:
+            cfg["x"] = position[0]
+            cfg["y"] = position[1]
         else:
-            pos_str = position.value if isinstance(position, ToastPosition) else str(position)
-            args.extend(["--position", pos_str])
-    if font_size is not None:
-        args.extend(["--font-size", str(font_size)])
-    if text_color is not None:
-        args.extend(["--text-color", _normalize_color(text_color)])
-    if corner_radius is not None:
-        args.extend(["--corner-radius", str(corner_radius)])
-    if display_duration is not None:
-        args.extend(["--display-duration", str(display_duration)])
-    if fade_out_duration is not None:
-        args.extend(["--fade-out-duration", str(fade_out_duration)])
-    if fade_in_duration is not None:
-        args.extend(["--fade-in-duration", str(fade_in_duration)])
+            cfg["position"] = _POS_TOKEN.get(position) or str(position)
     if window_level is not None:
-        wl_str = window_level.value if isinstance(window_level, WindowLevel) else str(window_level)
-        args.extend(["--window-level", wl_str])
-    if icon is not None:
-        args.extend(["--icon", str(icon)])
+        cfg["window-level"] = _WL_TOKEN.get(window_level) or str(window_level)
     if not click_to_dismiss:
-        args.append("--no-click-to-dismiss")
-    if sound is not None:
-        args.extend(["--sound", str(sound)])
+        cfg["click-to-dismiss"] = False
+
+    return cfg
+
+
+def _validate_toast_args(
+    message: str,
+    blocking: bool = True,
+    check: bool = False,
+    **kwargs,
+) -> dict:
+    """
+    Validate toast() arguments and return the normalized config dict.
 
-    # Message goes at the end
-    args.append(str(message))
+    The pure front half of toast(): runs every argument check and
+    color/geometry normalization but never resolves the executable or spawns
+    a process, so it works headless on any platform. Accepts the same
+    configuration keywords as toast().
+
+    Raises:
+        ToastConfigError: If parameters are invalid or incompatible.
+    """
+    if check and not blocking:
+        raise ToastConfigError(
+            "check=True only makes sense when blocking=True. "
+            "Non-blocking mode cannot check exit status."
+        )
+
+    # Lists are unhashable and would defeat _build_config's memoization.
+    for key in ("bg", "text_color", "position"):
+        value = kwargs.get(key)
+        if isinstance(value, list):
+            kwargs[key] = tuple(value)
+
+    try:
+        return _build_config(message, **kwargs)
+    except TypeError:
+        # Unhashable arguments (a dict color, a nested list inside a tuple)
+        # blow up in lru_cache's key hashing before any validator runs. Re-run
+        # the validation uncached so bad input still surfaces as
+        # ToastConfigError; genuine TypeErrors (unknown keywords) re-raise
+        # unchanged.
+        return _build_config.__wrapped__(message, **kwargs)
+
+
+def validate_many(cases) -> list:
+    """
+    Validate a batch of toast() argument sets in one call.
+
+    Each case is a dict of toast() keyword arguments, optionally including
+    "message". Returns a list with one entry per case: None when the case is
+    valid, otherwise the ToastConfigError it raised. One call amortizes the
+    per-case call overhead across the whole batch; nothing is ever spawned.
+    """
+    results = []
+    for case in cases:
+        opts = dict(case)
+        message = opts.pop("message", "mactoast")
+        try:
+            _validate_toast_args(message, **opts)
+            results.append(None)
+        except ToastConfigError as e:
+            results.append(e)
+    return results
+
+
+def toast(
+    message: str,
+    width: Optional[float] = None,
+    height: Optional[float] = None,
+    bg: Optional[ColorType] = None,
+    position: Optional[Union[ToastPosition, str, Tuple[float, float]]] = None,
+    font_size: Optional[float] = None,
+    text_color: Optional[ColorType] = None,
+    corner_radius: Optional[float] = None,
+    display_duration: Optional[float] = None,
+    fade_out_duration: Optional[float] = None,
+    fade_in_duration: Optional[float] = None,
+    window_level: Optional[Union[WindowLevel, str]] = None,
+    icon: Optional[str] = None,
+    click_to_dismiss: bool = True,
+    auto_size: bool = False,
+    min_width: Optional[float] = None,
+    max_width: Optional[float] = None,
+    sound: Optional[str] = None,
+    blocking: bool = True,
+    check: bool = False,
+    daemon: bool = False,
+    capture_output: bool = False,
+    background: bool = False,
+    coalesce_window: float = 0.0,
+    fast: bool = False,
+    dry_run: bool = False,
+) -> Union[
+    subprocess.CompletedProcess,
+    subprocess.Popen,
+    concurrent.futures.Future,
+    _SpawnedToast,
+    None,
+]:
+    """
+    Show a macOS HUD toast using the bundled ToastHUD.app.
+
+    Args:
+        message: The message to display.
+        width: Width of the toast in points (ignored if auto_size=True).
+        height: Height of the toast in points (ignored if auto_size=True).
+        bg: Background color (hex string or (r,g,b) tuple of 0-1 floats).
+        position: Position on screen ("top-right", "center", etc) or (x, y) coordinates.
+        font_size: Font size in points. Default: 14.
+        text_color: Text color (hex string or (r,g,b) tuple of 0-1 floats).
+        corner_radius: Corner radius in points (auto-adjusted if auto_size=True).
+        display_duration: How long to show the toast (seconds). Default: 2.5.
+        fade_out_duration: Duration of fade out animation (seconds). Default: 0.2.
+        fade_in_duration: Duration of fade in animation (seconds). Default: 0.2.
+        window_level: Window level ("normal", "floating", "status", "modal", "max").
+        icon: SF Symbol name (e.g., "checkmark.circle.fill", "xmark.circle.fill").
+        click_to_dismiss: If True, clicking the toast dismisses it. Default: True.
+        auto_size: If True, automatically size the toast based on content. Default: False.
+        min_width: Minimum width when auto_size=True. Default: 100.
+        max_width: Maximum width when auto_size=True. Default: 400.
+        sound: Sound name ('click1', 'confirmation1', 'confirmation2') or absolute path. Default: None (no sound).
+        blocking: If True, wait for the toast to close before returning.
+        check: If True, raise a CalledProcessError if the toast app fails (only if blocking=True).
+        daemon: If True, send the toast to a single long-lived ToastHUD helper
+            over stdin instead of spawning one process per toast. Amortizes
+            Cocoa startup across bursts of notifications; requires a ToastHUD
+            build with --daemon support. Default: False.
+        capture_output: If True, capture ToastHUD's stdout/stderr on the
+            returned object. By default both are discarded, which avoids the
+            pipe setup and decoding cost for fire-and-forget toasts.
+        background: If True, run the toast on a shared thread pool and return
+            a concurrent.futures.Future immediately. Recommended for rumps or
+            other AppKit apps whose handlers must not block the run loop.
+        coalesce_window: If > 0, drop this toast (returning None) when an
+            identical one - same message, background and position - was
+            dispatched within that many seconds. Default: 0.0 (disabled).
+        fast: With blocking=False, spawn via os.posix_spawn and return a
+            lightweight pid handle instead of a subprocess.Popen. Skips pipe
+            creation entirely for fire-and-forget toasts. Default: False.
+        dry_run: If True (or MACTOAST_DRY_RUN=1 is set), validate arguments
+            and build the full config, then return None without spawning
+            anything. Works on any platform. Default: False.
+
+    Returns:
+        subprocess.CompletedProcess when blocking=True; subprocess.Popen when
+        blocking=False (the shared helper's Popen when daemon=True); a
+        concurrent.futures.Future resolving to the CompletedProcess when
+        background=True; a lightweight pid handle with .pid and .wait() when
+        fast=True; None for dry runs and coalesced toasts.
+
+    Raises:
+        ToastConfigError: If parameters are invalid or incompatible.
+        RuntimeError: If not running on macOS.
+        FileNotFoundError: If ToastHUD.app executable is not found.
+    """
+    cfg = _validate_toast_args(
+        message,
+        blocking=blocking,
+        check=check,
+        width=width,
+        height=height,
+        bg=bg,
+        position=position,
+        font_size=font_size,
+        text_color=text_color,
+        corner_radius=corner_radius,
+        display_duration=display_duration,
+        fade_out_duration=fade_out_duration,
+        fade_in_duration=fade_in_duration,
+        window_level=window_level,
+        icon=icon,
+        click_to_dismiss=click_to_dismiss,
+        auto_size=auto_size,
+        min_width=min_width,
+        max_width=max_width,
+        sound=sound,
+    )
+
+    # Dry-run (also via MACTOAST_DRY_RUN=1, read per call so test harnesses
+    # can set it after import): validated config built, nothing spawned.
+    if dry_run or os.environ.get("MACTOAST_DRY_RUN") == "1":
+        return None
+
+    _load_subprocess()
+    exe = _get_executable_path()
+
+    if coalesce_window > 0.0:
+        key = (message, cfg.get("bg"), cfg.get("position"), cfg.get("x"), cfg.get("y"))
+        now = time.monotonic()
+        if now - _LAST_DISPATCH.get(key, float("-inf")) < coalesce_window:
+            return None
+        _LAST_DISPATCH[key] = now
+
+    if daemon:
+        global _HELPER_SEQ
+        _HELPER_SEQ += 1
+        token = str(_HELPER_SEQ)
+        payload = dict(cfg)  # cfg is cached and must stay unmutated
+        payload["message"] = str(message)
+        payload["id"] = token
+        helper = _get_helper()
+        helper.stdin.write(json.dumps(payload) + "\n")
+        helper.stdin.flush()
+        if blocking:
+            # The helper echoes each toast's id once it has been dismissed.
+            # Skip acks belonging to earlier (e.g. non-blocking) toasts -
+            # including any already pulled into the reader's buffer before a
+            # drain - until ours arrives; EOF means the helper died.
+            while True:
+                line = helper.stdout.readline()
+                if not line or line.strip() == token:
+                    break
+        else:
+            _drain_helper_acks(helper)
+        return helper
+
+    args = [exe]
+    if _USE_JSON_ARGV:
+        payload = dict(cfg)  # cfg is cached and must stay unmutated
+        payload["message"] = str(message)
+        args += ("--config", json.dumps(payload, separators=(",", ":")))
+    else:
+        for key, value in cfg.items():
+            if key == "click-to-dismiss":
+                args.append("--no-click-to-dismiss")
+            else:
+                # += with a tuple extends in place without an intermediate list.
+                args += (_FLAG_TOKEN[key], value if isinstance(value, str) else _fmt_num(value))
+
+        # Message goes at the end
+        args.append(str(message))
+
+    if background:
+        return _get_executor().submit(
+            _run,
+            args,
+            check=check,
+            stdout=_DEVNULL,
+            stderr=_DEVNULL,
+        )
 
     if blocking:
-        return subprocess.run(args, check=check, capture_output=True, text=True)
-    
-    return subprocess.Popen(args, text=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        if capture_output:
+            return _run(args, check=check, capture_output=True, text=True)
+        return _run(args, check=check, stdout=_DEVNULL, stderr=_DEVNULL)
+
+    if fast:
+        _reap_fast_pids()
+        pid = os.posix_spawn(exe, args, dict(os.environ))
+        _FAST_PIDS.append(pid)
+        return _SpawnedToast(pid)
+
+    if capture_output:
+        return _Popen(args, text=True, stdout=_PIPE, stderr=_PIPE)
+    # Discard output by default: unread PIPEs leak two fds per toast and can
+    # deadlock the child once its 64 KB pipe buffer fills.
+    return _Popen(args, stdout=_DEVNULL, stderr=_DEVNULL)
+
+
+def toast_sequence(
+    items,
+    blocking: bool = True,
+    check: bool = False,
+) -> Union[subprocess.CompletedProcess, subprocess.Popen]:
+    """
+    Show several toasts from a single ToastHUD invocation.
+
+    Each item is a dict of toast() keyword arguments plus a 'message' key.
+    The whole queue is serialized as newline-delimited JSON and handed to one
+    ToastHUD process via --batch, so Cocoa startup is paid once for the
+    sequence instead of once per toast. Toasts are displayed back to back in
+    order; requires a ToastHUD build with --batch support.
+
+    Args:
+        items: Iterable of dicts, each with a 'message' key plus any styling
+            keywords accepted by toast().
+        blocking: If True, wait until every toast has been shown.
+        check: If True, raise a CalledProcessError if the toast app fails
+            (only if blocking=True).
+
+    Raises:
+        ToastConfigError: If items is empty or any item is invalid.
+    """
+    lines = []
+    for item in items:
+        opts = dict(item)
+        message = opts.pop("message", None)
+        if not message or not isinstance(message, str):
+            raise ToastConfigError(
+                "each toast_sequence item must have a non-empty 'message'"
+            )
+        payload = dict(_validate_toast_args(message, **opts))
+        payload["message"] = message
+        lines.append(json.dumps(payload, separators=(",", ":")))
+
+    if not lines:
+        raise ToastConfigError("toast_sequence requires at least one toast")
+
+    if check and not blocking:
+        raise ToastConfigError(
+            "check=True only makes sense when blocking=True. "
+            "Non-blocking mode cannot check exit status."
+        )
+
+    _load_subprocess()
+    args = [_get_executable_path(), "--batch", "\n".join(lines)]
+
+    if blocking:
+        return _run(args, check=check, stdout=_DEVNULL, stderr=_DEVNULL)
+    return _Popen(args, stdout=_DEVNULL, stderr=_DEVNULL)
 
 
 if __name__ == "__main__":
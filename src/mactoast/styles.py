@@ -4,50 +4,59 @@ This module provides convenient style presets and helper functions for showing
 toast notifications with common styling patterns (success, error, warning, info).
 """
 
+from types import MappingProxyType
 from typing import Any
-from mactoast._runner import toast
+
+from mactoast._runner import toast, _normalize_color
 
 
 class ToastStyle:
-    """Predefined toast styles for common notification types."""
-    
+    """Predefined toast styles for common notification types.
+
+    Colors are normalized to hex strings once at import so every show_*()
+    call forwards a value that short-circuits color conversion in toast().
+    The presets are read-only mappings: the show_*() helpers merge them with
+    caller overrides in one expression instead of copy()+update(), and
+    accidental mutation of a class-level preset is a TypeError.
+    """
+
     # Success: Green background with dark text
-    SUCCESS = {
-        'bg': (0.2, 0.8, 0.3),  # Green
-        'text_color': (0.0, 0.0, 0.0),  # Black
+    SUCCESS = MappingProxyType({
+        'bg': _normalize_color((0.2, 0.8, 0.3)),  # Green
+        'text_color': _normalize_color((0.0, 0.0, 0.0)),  # Black
         'icon': 'checkmark.circle.fill',
         'sound': 'confirmation1',
-    }
-    
+    })
+
     # Error: Red background with white text
-    ERROR = {
-        'bg': (0.9, 0.2, 0.2),  # Red
-        'text_color': (1.0, 1.0, 1.0),  # White
+    ERROR = MappingProxyType({
+        'bg': _normalize_color((0.9, 0.2, 0.2)),  # Red
+        'text_color': _normalize_color((1.0, 1.0, 1.0)),  # White
         'icon': 'xmark.circle.fill',
         'sound': 'beep1',
-    }
-    
+    })
+
     # Warning: Orange/Yellow background with dark text
-    WARNING = {
-        'bg': (1.0, 0.6, 0.0),  # Orange
-        'text_color': (0.0, 0.0, 0.0),  # Black
+    WARNING = MappingProxyType({
+        'bg': _normalize_color((1.0, 0.6, 0.0)),  # Orange
+        'text_color': _normalize_color((0.0, 0.0, 0.0)),  # Black
         'icon': 'exclamationmark.triangle.fill',
         'sound': 'beep1',
-    }
-    
+    })
+
     # Info: Blue background with white text
-    INFO = {
-        'bg': (0.2, 0.5, 0.9),  # Blue
-        'text_color': (1.0, 1.0, 1.0),  # White
+    INFO = MappingProxyType({
+        'bg': _normalize_color((0.2, 0.5, 0.9)),  # Blue
+        'text_color': _normalize_color((1.0, 1.0, 1.0)),  # White
         'icon': 'info.circle.fill',
         'sound': 'confirmation2',
-    }
-    
+    })
+
     # Default: Dark gray background with white text
-    DEFAULT = {
-        'bg': (0.2, 0.2, 0.2),  # Dark gray
-        'text_color': (1.0, 1.0, 1.0),  # White
-    }
+    DEFAULT = MappingProxyType({
+        'bg': _normalize_color((0.2, 0.2, 0.2)),  # Dark gray
+        'text_color': _normalize_color((1.0, 1.0, 1.0)),  # White
+    })
 
 
 def show_success(message: str, **kwargs: Any):
@@ -62,9 +71,7 @@ def show_success(message: str, **kwargs: Any):
         >>> from mactoast import show_success
         >>> show_success("File saved successfully!")
     """
-    style = ToastStyle.SUCCESS.copy()
-    style.update(kwargs)
-    return toast(message, **style)
+    return toast(message, **{**ToastStyle.SUCCESS, **kwargs})
 
 
 def show_error(message: str, **kwargs: Any):
@@ -79,9 +86,7 @@ def show_error(message: str, **kwargs: Any):
         >>> from mactoast import show_error
         >>> show_error("Failed to load file")
     """
-    style = ToastStyle.ERROR.copy()
-    style.update(kwargs)
-    return toast(message, **style)
+    return toast(message, **{**ToastStyle.ERROR, **kwargs})
 
 
 def show_warning(message: str, **kwargs: Any):
@@ -96,9 +101,7 @@ def show_warning(message: str, **kwargs: Any):
         >>> from mactoast import show_warning
         >>> show_warning("Low disk space")
     """
-    style = ToastStyle.WARNING.copy()
-    style.update(kwargs)
-    return toast(message, **style)
+    return toast(message, **{**ToastStyle.WARNING, **kwargs})
 
 
 def show_info(message: str, **kwargs: Any):
@@ -113,9 +116,7 @@ def show_info(message: str, **kwargs: Any):
         >>> from mactoast import show_info
         >>> show_info("Update available")
     """
-    style = ToastStyle.INFO.copy()
-    style.update(kwargs)
-    return toast(message, **style)
+    return toast(message, **{**ToastStyle.INFO, **kwargs})
 
 
 __all__ = [
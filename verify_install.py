@@ -1,137 +1,64 @@
 #!/usr/bin/env python3
 """
-Quick verification test for mactoast package.
-Run this after installing to verify everything works.
+Quick verification tests for the mactoast package.
+Run `pytest verify_install.py` after installing to verify everything works;
+add --runslow to include the preset display walk, and set MACTOAST_DRY_RUN=0
+to actually see the toasts.
 """
 
-import sys
-import time
+import os
+
+import pytest
+
+# Dry-run by default so verification runs headless (CI, non-macOS dev boxes):
+# every toast() call validates and builds its config, then returns without
+# displaying. Set MACTOAST_DRY_RUN=0 before running to actually see the toasts.
+os.environ.setdefault("MACTOAST_DRY_RUN", "1")
+
+# One module-level import shared by every test; test_import keeps its own
+# inline import since importability is the thing it checks.
+import mactoast as _mt
+
 
 def test_import():
-    """Test basic import."""
-    print("Testing import...", end=" ")
-    try:
-        import mactoast
-        from mactoast import toast, show_success, show_error, show_warning, show_info
-        from mactoast import ToastPosition, WindowLevel
-        print("✅")
-        return True
-    except Exception as e:
-        print(f"❌ {e}")
-        return False
+    import mactoast
+    from mactoast import toast, show_success, show_error, show_warning, show_info
+    from mactoast import ToastPosition, WindowLevel
+
 
 def test_basic_toast():
-    """Test basic toast."""
-    print("Testing basic toast...", end=" ")
-    try:
-        import mactoast
-        mactoast.toast("Basic test", display_duration=1, blocking=True)
-        print("✅")
-        return True
-    except Exception as e:
-        print(f"❌ {e}")
-        return False
+    _mt.toast("Basic test", display_duration=1, blocking=True)
+
 
 def test_with_icon():
-    """Test toast with icon."""
-    print("Testing icon...", end=" ")
-    try:
-        import mactoast
-        mactoast.toast("Icon test", icon="star.fill", display_duration=1, blocking=True)
-        print("✅")
-        return True
-    except Exception as e:
-        print(f"❌ {e}")
-        return False
+    _mt.toast("Icon test", icon="star.fill", display_duration=1, blocking=True)
+
 
 def test_with_sound():
-    """Test toast with sound."""
-    print("Testing sound...", end=" ")
-    try:
-        import mactoast
-        mactoast.toast("Sound test", sound="beep1", display_duration=1, blocking=True)
-        print("✅")
-        return True
-    except Exception as e:
-        print(f"❌ {e}")
-        return False
+    _mt.toast("Sound test", sound="beep1", display_duration=1, blocking=True)
+
 
 def test_auto_size():
-    """Test auto-size."""
-    print("Testing auto-size...", end=" ")
-    try:
-        import mactoast
-        mactoast.toast("Auto-size test!", auto_size=True, display_duration=1, blocking=True)
-        print("✅")
-        return True
-    except Exception as e:
-        print(f"❌ {e}")
-        return False
+    _mt.toast("Auto-size test!", auto_size=True, display_duration=1, blocking=True)
+
 
+@pytest.mark.slow
 def test_presets():
-    """Test preset styles."""
-    print("Testing presets...", end=" ")
-    try:
-        import mactoast
-        mactoast.show_success("Success!", display_duration=1, blocking=True)
-        time.sleep(0.3)
-        mactoast.show_error("Error!", display_duration=1, blocking=True)
-        time.sleep(0.3)
-        mactoast.show_warning("Warning!", display_duration=1, blocking=True)
-        time.sleep(0.3)
-        mactoast.show_info("Info!", display_duration=1, blocking=True)
-        print("✅")
-        return True
-    except Exception as e:
-        print(f"❌ {e}")
-        return False
+    # blocking=True already waits for each toast to close; no extra
+    # sleep is needed between presets.
+    _mt.show_success("Success!", display_duration=1, blocking=True)
+    _mt.show_error("Error!", display_duration=1, blocking=True)
+    _mt.show_warning("Warning!", display_duration=1, blocking=True)
+    _mt.show_info("Info!", display_duration=1, blocking=True)
+
 
 def test_non_blocking():
-    """Test non-blocking mode."""
-    print("Testing non-blocking...", end=" ")
-    try:
-        import mactoast
-        p = mactoast.toast("Non-blocking test", display_duration=1, blocking=False)
-        if p and hasattr(p, 'pid'):
-            print("✅")
-            return True
-        else:
-            print("❌ No process returned")
-            return False
-    except Exception as e:
-        print(f"❌ {e}")
-        return False
-
-def main():
-    print("=" * 50)
-    print("Mactoast Package Verification")
-    print("=" * 50)
-    print()
-    
-    tests = [
-        test_import,
-        test_basic_toast,
-        test_with_icon,
-        test_with_sound,
-        test_auto_size,
-        test_presets,
-        test_non_blocking,
-    ]
-    
-    results = [test() for test in tests]
-    
-    print()
-    print("=" * 50)
-    passed = sum(results)
-    total = len(results)
-    print(f"Results: {passed}/{total} tests passed")
-    
-    if passed == total:
-        print("✅ All tests passed!")
-        return 0
+    p = _mt.toast("Non-blocking test", display_duration=1, blocking=False)
+    if os.environ.get("MACTOAST_DRY_RUN") == "1":
+        assert p is None  # dry-run spawns nothing
     else:
-        print(f"❌ {total - passed} test(s) failed")
-        return 1
+        assert p is not None and hasattr(p, "pid")
+
 
 if __name__ == "__main__":
-    sys.exit(main())
+    raise SystemExit(pytest.main([__file__]))